@@ -0,0 +1,56 @@
+## Numba-compiled Feistel block loops for main.py (optional)
+# --------------------------------------------------------------
+# Imported by main.py only for long messages, so short runs never pay for
+# loading Numba. Importing this module raises ImportError without Numba.
+
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def encrypt_blocks_jit(halves, chunk_states, chunk_blocks, ps16, rounds):
+    """
+    Encrypt blocks in native code, one chunk per worker.
+    halves is an (n_blocks, 2) uint16 array of (L, R) pairs, so the halves
+    are loaded and stored at their natural width without shifts or masks.
+    The LFSR step is inlined so subkeys are produced as the rounds run.
+    """
+    out = np.empty_like(halves)
+    n_blocks = halves.shape[0]
+    for c in prange(chunk_states.shape[0]):
+        state = chunk_states[c]
+        for i in range(c * chunk_blocks, min(n_blocks, (c + 1) * chunk_blocks)):
+            L = halves[i, 0]
+            R = halves[i, 1]
+            for _ in range(rounds):
+                new_bit = (state ^ (state >> 1) ^ (state >> 21) ^ (state >> 31)) & 1
+                state = ((state >> 1) & 0x7FFFFFFF) | (new_bit << 31)
+                F = ps16[R] ^ (state & 0xFFFF)
+                L, R = R, L ^ F
+            out[i, 0] = L
+            out[i, 1] = R
+    return out
+
+@njit(parallel=True, cache=True)
+def decrypt_blocks_jit(halves, chunk_states, chunk_blocks, ps16, rounds):
+    """
+    Decrypt (L, R) uint16 block halves in native code, one chunk per worker,
+    applying the subkeys of each block in reverse order.
+    """
+    out = np.empty_like(halves)
+    n_blocks = halves.shape[0]
+    for c in prange(chunk_states.shape[0]):
+        subkeys = np.empty(rounds, dtype=np.uint16)
+        state = chunk_states[c]
+        for i in range(c * chunk_blocks, min(n_blocks, (c + 1) * chunk_blocks)):
+            for r in range(rounds):
+                new_bit = (state ^ (state >> 1) ^ (state >> 21) ^ (state >> 31)) & 1
+                state = ((state >> 1) & 0x7FFFFFFF) | (new_bit << 31)
+                subkeys[r] = state
+            L = halves[i, 0]
+            R = halves[i, 1]
+            for r in range(rounds - 1, -1, -1):
+                F = ps16[L] ^ subkeys[r]
+                L, R = R ^ F, L
+            out[i, 0] = L
+            out[i, 1] = R
+    return out
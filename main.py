@@ -2,8 +2,21 @@
 # --------------------------------------------------------------
 # Author: Phanidhar Akula
 
+import array
+import functools
 import secrets
 import random
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python block loop is used without it
+    np = None
+
+try:
+    import feistel_core  # compiled from feistel_core.pyx with Cython
+except ImportError:  # the C extension is optional
+    feistel_core = None
 
 # ----------------- Bit Manipulation Functions ----------------- #
 def rotate_left_16(x, n):
@@ -13,23 +26,73 @@ def rotate_left_16(x, n):
     n = n % 16
     return ((x << n) & 0xFFFF) | (x >> (16 - n))
 
+def _combine_byte_tables(lo, hi):
+    """
+    Build a 65536-entry uint16 table holding hi[x >> 8] ^ lo[x & 0xFF].
+    The table is one contiguous 128 KB block, small enough to stay in L2 cache,
+    and it is filled 256 entries at a time so no 65536-element list of
+    boxed ints is ever built.
+    """
+    table = array.array('H', bytes(2 * 65536))
+    for h, hv in enumerate(hi):
+        table[h << 8:(h + 1) << 8] = array.array('H', [hv ^ lv for lv in lo])
+    return table
+
 # ----------------- LFSR Key Scheduling ----------------- #
 def lfsr_step(state):
     """
     Advance a 32-bit LFSR one step using taps at positions 0, 1, 21, and 31.
     Returns the new state and an output word (here, the entire state).
     """
-    b0 = (state >> 0) & 1
-    b1 = (state >> 1) & 1
-    b21 = (state >> 21) & 1
-    b31 = (state >> 31) & 1
-    new_bit = b0 ^ b1 ^ b21 ^ b31
-
-    state = (state >> 1) & 0x7FFFFFFF
-    if new_bit == 1:
-        state |= (1 << 31)
+    # XOR the state with itself shifted onto each tap; bit 0 is then b0 ^ b1 ^ b21 ^ b31.
+    new_bit = (state ^ (state >> 1) ^ (state >> 21) ^ (state >> 31)) & 1
+    state = ((state >> 1) & 0x7FFFFFFF) | (new_bit << 31)
     return state, state
 
+def lfsr_subkeys(lfsr_state, count):
+    """
+    Advance the LFSR count times, keeping the lower 16 bits of each output word.
+    Returns the list of subkeys and the updated LFSR state.
+    """
+    subkeys = []
+    current_state = lfsr_state
+    for _ in range(count):
+        current_state, out_word = lfsr_step(current_state)
+        subkeys.append(out_word & 0xFFFF)
+    return subkeys, current_state
+
+def lfsr_jump(state, columns):
+    """
+    Apply an LFSR jump matrix to a 32-bit state.
+    The LFSR is linear over GF(2), so the state after k steps is M^k * state;
+    the product is the XOR of the matrix columns selected by the set state bits.
+    """
+    result = 0
+    j = 0
+    while state:
+        if state & 1:
+            result ^= columns[j]
+        state >>= 1
+        j += 1
+    return result
+
+@functools.lru_cache(maxsize=None)
+def lfsr_jump_matrix(steps):
+    """
+    Compute the LFSR transition matrix raised to the given number of steps.
+    The matrix is returned as 32 column words: column j is the state reached
+    after `steps` steps from the state with only bit j set.
+    """
+    # One-step matrix, squared and multiplied in as the bits of `steps` demand.
+    power = tuple(lfsr_step(1 << j)[0] for j in range(32))
+    result = tuple(1 << j for j in range(32))
+    while steps:
+        if steps & 1:
+            result = tuple(lfsr_jump(col, power) for col in result)
+        power = tuple(lfsr_jump(col, power) for col in power)
+        steps >>= 1
+    return result
+
 # ------------------ Key-Dependent S-Box Generation -------------------- #
 def generate_s_box(key):
     """
@@ -49,33 +112,81 @@ def generate_s_box(key):
 s_box_nibble = None
 inverse_s_box_nibble = None
 
+# Full 16-bit S-box lookup tables (built from the nibble S-box by init_round_tables)
+S16 = None
+INV_S16 = None
+# Fused P-box(S-box(x)) table used by the round function
+PS16 = None
+# NumPy view of PS16 for the batched Feistel network (None without NumPy)
+PS16_np = None
+# The (S-box, inverse S-box) pair the tables above were built from
+_round_tables_source = None
+
+def build_s16_table(nibble_box):
+    """
+    Expand a 4-bit S-box into a 65536-entry table that substitutes
+    all four nibbles of a 16-bit value with a single lookup.
+    """
+    # Substitute both nibbles of every byte first, then pair the bytes up.
+    s8 = [nibble_box[b & 0xF] | (nibble_box[b >> 4] << 4) for b in range(256)]
+    return _combine_byte_tables(s8, [v << 8 for v in s8])
+
+def build_ps16_table(nibble_box):
+    """
+    Build the fused P-box(S-box(x)) table used by the round function.
+    The P-box is linear, so P(S(x)) is the XOR of P applied to each
+    substituted nibble in place. Those four 16-entry tables are combined
+    into the full 65536-entry table, AES T-table style.
+    """
+    t0, t1, t2, t3 = ([P16[nibble_box[n] << shift] for n in range(16)]
+                      for shift in (0, 4, 8, 12))
+    # Low byte and high byte contributions, 256 entries each.
+    lo = [t0[b & 0xF] ^ t1[b >> 4] for b in range(256)]
+    hi = [t2[b & 0xF] ^ t3[b >> 4] for b in range(256)]
+    return _combine_byte_tables(lo, hi)
+
+def init_round_tables():
+    """
+    Build the 16-bit lookup tables from the current S-box.
+    The cipher functions call this through ensure_round_tables whenever
+    s_box_nibble changes, so calling it directly is optional.
+    """
+    global S16, INV_S16, PS16, PS16_np, _round_tables_source
+    if s_box_nibble is None or inverse_s_box_nibble is None:
+        raise ValueError("S-box not generated: set s_box_nibble and "
+                         "inverse_s_box_nibble from generate_s_box(key) first.")
+    S16 = build_s16_table(s_box_nibble)
+    INV_S16 = build_s16_table(inverse_s_box_nibble)
+    PS16 = build_ps16_table(s_box_nibble)
+    if np is not None:
+        PS16_np = np.frombuffer(PS16, dtype=np.uint16)
+    _round_tables_source = (tuple(s_box_nibble), tuple(inverse_s_box_nibble))
+
+def ensure_round_tables():
+    """
+    Rebuild the 16-bit lookup tables if they are missing or were built
+    from a different S-box than the current s_box_nibble.
+    """
+    if (s_box_nibble is None or inverse_s_box_nibble is None
+            or _round_tables_source != (tuple(s_box_nibble), tuple(inverse_s_box_nibble))):
+        init_round_tables()
+
 def s_box(x):
     """
     Apply S-box substitution on a 16-bit value x.
-    Process x four bits at a time using the generated s_box_nibble.
     """
-    result = 0
-    for i in range(4):
-        nibble = (x >> (i * 4)) & 0xF
-        sub = s_box_nibble[nibble]
-        result |= (sub << (i * 4))
-    return result
+    return S16[x]
 
 def inverse_s_box(x):
     """
     Apply the inverse S-box substitution on a 16-bit value.
     """
-    result = 0
-    for i in range(4):
-        nibble = (x >> (i * 4)) & 0xF
-        sub = inverse_s_box_nibble[nibble]
-        result |= (sub << (i * 4))
-    return result
+    return INV_S16[x]
 
 # ------------------ P-Box and its Inverse -------------------- #
-def p_box(x):
+def _p_box_bits(x):
     """
-    Permutation (P-box) on a 16-bit value.
+    Permutation (P-box) on a 16-bit value, computed bit by bit.
     Each bit at position i moves to position (i * 3) mod 16.
     """
     result = 0
@@ -85,9 +196,9 @@ def p_box(x):
         result |= (bit << new_pos)
     return result
 
-def inverse_p_box(x):
+def _inverse_p_box_bits(x):
     """
-    Inverse permutation for the P-box.
+    Inverse permutation for the P-box, computed bit by bit.
     Mapping is derived from P(i) = (i * 3) mod 16.
     """
     mapping = {
@@ -103,12 +214,48 @@ def inverse_p_box(x):
         result |= (bit << original_pos)
     return result
 
+def _byte_split_table(permute_bits):
+    """
+    Tabulate a 16-bit bit permutation for every input value.
+    A bit permutation is linear over GF(2), so it splits into one 8-bit map
+    for the low input byte and one for the high byte, whose results are XORed.
+    Only those 2 x 256 entries are computed bit by bit.
+    """
+    lo = [permute_bits(b) for b in range(256)]
+    hi = [permute_bits(b << 8) for b in range(256)]
+    return _combine_byte_tables(lo, hi)
+
+# The P-box is fixed, so both directions are tabulated once at import time.
+P16 = _byte_split_table(_p_box_bits)
+INV_P16 = _byte_split_table(_inverse_p_box_bits)
+
+def p_box(x):
+    """
+    Permutation (P-box) on a 16-bit value.
+    Each bit at position i moves to position (i * 3) mod 16.
+    """
+    return P16[x]
+
+def inverse_p_box(x):
+    """
+    Inverse permutation for the P-box.
+    """
+    return INV_P16[x]
+
 # ----------------- Feistel Round Functions ----------------- #
+def print_round_subkeys(title, subkeys):
+    """
+    Print the subkeys of one block in the order they are applied.
+    """
+    print(f"\n-------{title}-------")
+    for i, sk in enumerate(subkeys, start=1):
+        print(f"Round {i} subkey: {sk:04X}")
+
 def round_function(x, subkey):
     """
     Compute the round function F(x, subkey) = P-box(S-box(x)) XOR subkey.
     """
-    return p_box(s_box(x)) ^ (subkey & 0xFFFF)
+    return PS16[x] ^ (subkey & 0xFFFF)
 
 def encrypt_block(block, lfsr_state, rounds=4, print_subkeys=True):
     """
@@ -120,19 +267,14 @@ def encrypt_block(block, lfsr_state, rounds=4, print_subkeys=True):
       - Set new_L = R and new_R = L XOR F.
     Returns the encrypted block and the updated LFSR state.
     """
+    ensure_round_tables()
     L = (block >> 16) & 0xFFFF
     R = block & 0xFFFF
 
-    current_state = lfsr_state
-    subkeys = []
-    for _ in range(rounds):
-        current_state, out_word = lfsr_step(current_state)
-        subkeys.append(out_word & 0xFFFF)
+    subkeys, current_state = lfsr_subkeys(lfsr_state, rounds)
 
     if print_subkeys:
-        print("\n-------Encryption-------")
-        for i, sk in enumerate(subkeys, start=1):
-            print(f"Round {i} subkey: {sk:04X}")
+        print_round_subkeys("Encryption", subkeys)
 
     for i in range(rounds):
         F = round_function(R, subkeys[i])
@@ -151,19 +293,14 @@ def decrypt_block(block, lfsr_state, rounds=4, print_subkeys=True):
       - Set new_R = L and new_L = R XOR F.
     Returns the decrypted block and the updated LFSR state.
     """
+    ensure_round_tables()
     L = (block >> 16) & 0xFFFF
     R = block & 0xFFFF
 
-    current_state = lfsr_state
-    subkeys = []
-    for _ in range(rounds):
-        current_state, out_word = lfsr_step(current_state)
-        subkeys.append(out_word & 0xFFFF)
+    subkeys, current_state = lfsr_subkeys(lfsr_state, rounds)
 
     if print_subkeys:
-        print("\n-------Decryption-------")
-        for i, sk in enumerate(reversed(subkeys), start=1):
-            print(f"Round {i} subkey: {sk:04X}")
+        print_round_subkeys("Decryption", reversed(subkeys))
 
     for subkey in reversed(subkeys):
         F = round_function(L, subkey)
@@ -174,7 +311,140 @@ def decrypt_block(block, lfsr_state, rounds=4, print_subkeys=True):
     decrypted_block = ((L & 0xFFFF) << 16) | (R & 0xFFFF)
     return decrypted_block, current_state
 
+# One inlined LFSR step on the local `state`, matching lfsr_step.
+_LFSR_STEP_SRC = ("state = ((state >> 1) & 0x7FFFFFFF)"
+                  " | (((state ^ (state >> 1) ^ (state >> 21) ^ (state >> 31)) & 1) << 31)")
+
+@functools.lru_cache(maxsize=None)
+def unrolled_block_functions(rounds=4):
+    """
+    Generate block functions specialised for a fixed number of rounds.
+    The LFSR steps and Feistel rounds are written out one statement each,
+    so the generated code has no loops, no subkey list and no print flag.
+    Returns (encrypt, decrypt); each takes (block, lfsr_state) and returns
+    the processed block and the updated LFSR state, like encrypt_block.
+    """
+    enc = ["def encrypt(block, state):",
+           "    ps16 = PS16",
+           "    L = block >> 16",
+           "    R = block & 0xFFFF"]
+    for _ in range(rounds):
+        enc.append(f"    {_LFSR_STEP_SRC}")
+        enc.append("    L, R = R, L ^ ps16[R] ^ (state & 0xFFFF)")
+    enc.append("    return (L << 16) | R, state")
+
+    dec = ["def decrypt(block, state):",
+           "    ps16 = PS16"]
+    for r in range(rounds):
+        dec.append(f"    {_LFSR_STEP_SRC}")
+        dec.append(f"    k{r} = state & 0xFFFF")
+    dec.append("    L = block >> 16")
+    dec.append("    R = block & 0xFFFF")
+    for r in reversed(range(rounds)):
+        dec.append(f"    L, R = R ^ ps16[L] ^ k{r}, L")
+    dec.append("    return (L << 16) | R, state")
+
+    namespace = {}
+    exec("\n".join(enc + dec), globals(), namespace)
+    return namespace["encrypt"], namespace["decrypt"]
+
+# Specialise the default 4-round cipher up front.
+unrolled_block_functions(4)
+
+# ----------------- Batched (NumPy) Feistel Network ----------------- #
+def lfsr_jump_np(states, columns):
+    """
+    Apply an LFSR jump matrix to every state in a uint32 array.
+    The columns are folded into four 256-entry tables, one per state byte,
+    so each jump costs four table lookups per state.
+    """
+    tables = np.zeros((4, 256), dtype=np.uint32)
+    for k in range(4):
+        for i in range(8):
+            tables[k, 1 << i:2 << i] = tables[k, :1 << i] ^ columns[8 * k + i]
+    return (tables[0][states & 0xFF]
+            ^ tables[1][(states >> 8) & 0xFF]
+            ^ tables[2][(states >> 16) & 0xFF]
+            ^ tables[3][states >> 24])
+
+def generate_subkey_schedule(lfsr_state, n_blocks, rounds=4):
+    """
+    Run the LFSR ahead of time for a whole message.
+    Subkeys depend only on the key, never on the data, so they can be
+    generated before any block is processed.
+    Returns an (n_blocks, rounds) uint16 array of subkeys in encryption order.
+    """
+    # LFSR state at the start of each block. The states known so far are
+    # jumped forward together, doubling the filled prefix on every pass.
+    states = np.empty(n_blocks, dtype=np.uint32)
+    states[:1] = lfsr_state
+    filled = 1
+    jump = lfsr_jump_matrix(rounds)
+    while filled < n_blocks:
+        take = min(filled, n_blocks - filled)
+        states[filled:filled + take] = lfsr_jump_np(states[:take], jump)
+        filled += take
+        jump = tuple(lfsr_jump(col, jump) for col in jump)
+
+    # Stored round-major, so each round's subkeys are one contiguous run.
+    subkeys = np.empty((rounds, n_blocks), dtype=np.uint16)
+    for r in range(rounds):
+        if r < 16:
+            # The feedback bits enter at bit 31, so for the first 16 steps the
+            # low 16 bits are just bits r+1 .. r+16 of the block's start state.
+            # Storing into the uint16 array keeps only those low 16 bits.
+            subkeys[r] = states >> (r + 1)
+        else:
+            subkeys[r] = lfsr_jump_np(states, lfsr_jump_matrix(r + 1))
+    return subkeys.T
+
+def encrypt_blocks_np(blocks, subkeys):
+    """
+    Encrypt an array of 32-bit blocks with the Feistel network.
+    Each round is applied to every block at once, using subkeys[:, r]
+    as the round-r subkey of each block.
+    """
+    L = (blocks >> 16).astype(np.uint16)
+    R = blocks.astype(np.uint16)
+    for r in range(subkeys.shape[1]):
+        F = PS16_np[R] ^ subkeys[:, r]
+        L, R = R, L ^ F
+    return (L.astype(np.uint32) << 16) | R
+
+def decrypt_blocks_np(blocks, subkeys):
+    """
+    Decrypt an array of 32-bit blocks with the inverse Feistel network,
+    applying the subkeys of each block in reverse order.
+    """
+    L = (blocks >> 16).astype(np.uint16)
+    R = blocks.astype(np.uint16)
+    for r in reversed(range(subkeys.shape[1])):
+        F = PS16_np[L] ^ subkeys[:, r]
+        L, R = R ^ F, L
+    return (L.astype(np.uint32) << 16) | R
+
+# ----------------- Compiled (Numba) Feistel Network ----------------- #
+# Blocks handed to each parallel worker of the JIT kernels.
+JIT_CHUNK_BLOCKS = 16384
+
+def lfsr_chunk_states(lfsr_state, n_blocks, rounds=4, chunk_blocks=JIT_CHUNK_BLOCKS):
+    """
+    Compute the LFSR state at the start of every chunk of chunk_blocks blocks.
+    Each chunk is reached from the previous one with a single jump matrix,
+    so the chunks can then be encrypted independently of each other.
+    """
+    n_chunks = max(1, -(-n_blocks // chunk_blocks))
+    states = [lfsr_state]
+    if n_chunks > 1:
+        jump = lfsr_jump_matrix(rounds * chunk_blocks)
+        for _ in range(n_chunks - 1):
+            states.append(lfsr_jump(states[-1], jump))
+    return np.array(states, dtype=np.int64)
+
 # -------------------- Padding and Conversion ------------------- #
+# Big-endian packing of one 32-bit block
+_BLOCK_STRUCT = struct.Struct('>I')
+
 def pad_pkcs7(data, block_size=4):
     """
     Apply PKCS#7-like padding to data.
@@ -191,14 +461,17 @@ def unpad_pkcs7(data, block_size=4):
     pad_len = data[-1]
     if pad_len < 1 or pad_len > block_size:
         raise ValueError("Invalid padding detected.")
-    if any(p != pad_len for p in data[-pad_len:]):
+    if not data.endswith(bytes([pad_len]) * pad_len):
         raise ValueError("Invalid padding detected.")
     return data[:-pad_len]
 
 def bytes_to_blocks(data):
     """
     Convert a bytes object into a list of 32-bit integer blocks (4 bytes each).
+    With NumPy, a zero-copy big-endian uint32 array view of the data is returned instead.
     """
+    if np is not None:
+        return np.frombuffer(data, dtype='>u4')
     blocks = []
     for i in range(0, len(data), 4):
         chunk = data[i:i+4]
@@ -208,51 +481,155 @@ def bytes_to_blocks(data):
 
 def blocks_to_bytes(blocks):
     """
-    Convert a list of 32-bit integer blocks into a bytes object (4 bytes per block).
-    """
-    output = b""
-    for block in blocks:
-        output += block.to_bytes(4, byteorder='big')
-    return output
+    Convert 32-bit integer blocks into a bytes object (4 bytes per block, big-endian).
+    With NumPy, blocks may be a list or a uint32 array and is packed in one call.
+    """
+    if np is not None:
+        return np.asarray(blocks, dtype='>u4').tobytes()
+    return b"".join(block.to_bytes(4, byteorder='big') for block in blocks)
+
+# ----------------- Backend Selection ----------------- #
+# Messages shorter than this many blocks skip the NumPy and Numba paths,
+# whose import and first-call costs outweigh their per-block savings.
+BATCH_MIN_BLOCKS = 4096
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels():
+    """
+    Import the Numba kernels on first use.
+    Returns the feistel_jit module, or None when Numba is not installed.
+    """
+    try:
+        import feistel_jit
+    except ImportError:
+        return None
+    return feistel_jit
+
+def available_backends():
+    """
+    List the block-loop implementations usable in this environment.
+    """
+    backends = ["python"]
+    if np is not None:
+        backends.append("numpy")
+        if _jit_kernels() is not None:
+            backends.append("numba")
+    if feistel_core is not None:
+        backends.append("cython")
+    return backends
+
+def select_backend(n_blocks):
+    """
+    Pick the block-loop implementation for a message of n_blocks blocks.
+    Numba is preferred for long messages, then the Cython extension at any
+    length, then NumPy for long messages, then the unrolled Python functions.
+    """
+    if n_blocks >= BATCH_MIN_BLOCKS and np is not None and _jit_kernels() is not None:
+        return "numba"
+    if feistel_core is not None:
+        return "cython"
+    if n_blocks >= BATCH_MIN_BLOCKS and np is not None:
+        return "numpy"
+    return "python"
+
+def encrypt_padded(padded, key_32, rounds=4, backend=None):
+    """
+    Encrypt already padded data (a multiple of 4 bytes) with the given backend,
+    or with select_backend's choice when backend is None.
+    """
+    n_blocks = len(padded) // 4
+    if backend is None:
+        backend = select_backend(n_blocks)
+
+    if backend == "cython":
+        return feistel_core.encrypt_blocks_c(padded, key_32, rounds, PS16)
+
+    if backend == "numba":
+        chunk_states = lfsr_chunk_states(key_32, n_blocks, rounds)
+        halves = np.frombuffer(padded, dtype='>u2').reshape(-1, 2).astype(np.uint16)
+        halves = _jit_kernels().encrypt_blocks_jit(halves, chunk_states, JIT_CHUNK_BLOCKS,
+                                                   PS16_np, rounds)
+        return halves.astype('>u2').tobytes()
+
+    if backend == "numpy":
+        blocks = np.frombuffer(padded, dtype='>u4')
+        subkeys = generate_subkey_schedule(key_32, n_blocks, rounds)
+        return blocks_to_bytes(encrypt_blocks_np(blocks, subkeys))
+
+    # Encrypted blocks are written straight into a preallocated buffer.
+    output = bytearray(len(padded))
+    pack_into = _BLOCK_STRUCT.pack_into
+    encrypt_fast, _ = unrolled_block_functions(rounds)
+    lfsr_state = key_32
+    for offset, (blk,) in zip(range(0, len(padded), 4), _BLOCK_STRUCT.iter_unpack(padded)):
+        enc_blk, lfsr_state = encrypt_fast(blk, lfsr_state)
+        pack_into(output, offset, enc_blk)
+    return bytes(output)
+
+def decrypt_padded(data, key_32, rounds=4, backend=None):
+    """
+    Decrypt data (a multiple of 4 bytes) with the given backend, or with
+    select_backend's choice when backend is None. Padding is left in place.
+    """
+    n_blocks = len(data) // 4
+    if backend is None:
+        backend = select_backend(n_blocks)
+
+    if backend == "cython":
+        return feistel_core.decrypt_blocks_c(data, key_32, rounds, PS16)
+
+    if backend == "numba":
+        chunk_states = lfsr_chunk_states(key_32, n_blocks, rounds)
+        halves = np.frombuffer(data, dtype='>u2').reshape(-1, 2).astype(np.uint16)
+        halves = _jit_kernels().decrypt_blocks_jit(halves, chunk_states, JIT_CHUNK_BLOCKS,
+                                                   PS16_np, rounds)
+        return halves.astype('>u2').tobytes()
+
+    if backend == "numpy":
+        blocks = np.frombuffer(data, dtype='>u4')
+        subkeys = generate_subkey_schedule(key_32, n_blocks, rounds)
+        return blocks_to_bytes(decrypt_blocks_np(blocks, subkeys))
+
+    # Decrypted blocks are written straight into a preallocated buffer.
+    output = bytearray(len(data))
+    pack_into = _BLOCK_STRUCT.pack_into
+    _, decrypt_fast = unrolled_block_functions(rounds)
+    lfsr_state = key_32
+    for offset, (blk,) in zip(range(0, len(data), 4), _BLOCK_STRUCT.iter_unpack(data)):
+        dec_blk, lfsr_state = decrypt_fast(blk, lfsr_state)
+        pack_into(output, offset, dec_blk)
+    return bytes(output)
 
 def encrypt_message(plaintext: bytes, key_32: int, rounds=4) -> bytes:
     """
     Encrypt an arbitrary-length plaintext.
     1) Pad the plaintext.
     2) Split it into 32-bit blocks.
-    3) Encrypt each block sequentially.
+    3) Encrypt the blocks with the backend chosen by select_backend:
+       one block at a time, all blocks per round (NumPy), or in parallel
+       chunks (Numba).
     4) Return the ciphertext.
     """
+    ensure_round_tables()
     padded = pad_pkcs7(plaintext, 4)
-    blocks = bytes_to_blocks(padded)
-    
-    lfsr_state = key_32
-    encrypted_blocks = []
-    for idx, blk in enumerate(blocks):
-        # Print subkeys only for the first block
-        print_flag = True if idx == 0 else False
-        enc_blk, lfsr_state = encrypt_block(blk, lfsr_state, rounds=rounds, print_subkeys=print_flag)
-        encrypted_blocks.append(enc_blk)
-    
-    return blocks_to_bytes(encrypted_blocks)
+
+    # Print subkeys only for the first block
+    print_round_subkeys("Encryption", lfsr_subkeys(key_32, rounds)[0])
+    return encrypt_padded(padded, key_32, rounds)
 
 def decrypt_message(ciphertext: bytes, key_32: int, rounds=4) -> bytes:
     """
     Decrypt an arbitrary-length ciphertext.
     1) Split the ciphertext into 32-bit blocks.
-    2) Decrypt each block sequentially.
+    2) Decrypt the blocks with the backend chosen by select_backend.
     3) Remove the padding.
     """
-    blocks = bytes_to_blocks(ciphertext)
-    
-    lfsr_state = key_32
-    decrypted_blocks = []
-    for idx, blk in enumerate(blocks):
-        print_flag = True if idx == 0 else False
-        dec_blk, lfsr_state = decrypt_block(blk, lfsr_state, rounds=rounds, print_subkeys=print_flag)
-        decrypted_blocks.append(dec_blk)
-    
-    padded_plaintext = blocks_to_bytes(decrypted_blocks)
+    if not ciphertext or len(ciphertext) % 4:
+        raise ValueError("Ciphertext length must be a non-zero multiple of 4 bytes.")
+    ensure_round_tables()
+
+    print_round_subkeys("Decryption", reversed(lfsr_subkeys(key_32, rounds)[0]))
+    padded_plaintext = decrypt_padded(ciphertext, key_32, rounds)
     return unpad_pkcs7(padded_plaintext, 4)
 
 # ------------------ Print S-box Table ------------------ #
@@ -288,6 +665,7 @@ if __name__ == "__main__":
 
     # Generate S-box values based on the key.
     s_box_nibble, inverse_s_box_nibble = generate_s_box(key_32)
+    init_round_tables()
     
     # Print the S-box table.
     print_s_box_table()